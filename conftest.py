@@ -0,0 +1,2 @@
+# Root conftest: puts the repository root on sys.path so the tests can
+# import the library package when run with plain `pytest`.
@@ -0,0 +1,87 @@
+"""
+Numba kernel for DigitalResourceEstimator.sweep(backend="numba").
+
+Imported lazily by digital_resource_estimator, so numba is only loaded
+when the numba backend is requested.
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; only backend="numba" needs it
+    njit = None
+    prange = range
+
+
+def _sweep_loop(
+    logical_qubits, target_runtime, p, p_L,
+    t_gate_count, mof, cof, physical_gate_time,
+    d, qubits_per_logical, data_qubits, magic_state_qubits,
+    compilation_qubits, total_physical_qubits, logical_gate_count,
+    physical_gate_count, logical_error_rate, success_probability,
+    wall_clock_time_us,
+):
+    """Per-point resource formulas (see _sweep_numpy)."""
+    p_th = 0.01  # Surface code threshold
+
+    # Points are independent: no cross-iteration reductions
+    for i in prange(p.size):
+        d_i = max(math.ceil(2 * math.log(1.0 / p_L[i]) / math.log(p_th / p[i])), 3) | 1
+        qpl_i = 2 * d_i * d_i
+        data_i = logical_qubits[i] * qpl_i
+        magic_i = int((t_gate_count[i] * qpl_i) * mof[i])
+        comp_i = int(data_i * (cof[i] - 1.0))
+        lgc_i = int(target_runtime[i] / (d_i * physical_gate_time[i]))
+        p_L_i = 0.1 * (p[i] / p_th) ** ((d_i + 1) / 2)
+
+        d[i] = d_i
+        qubits_per_logical[i] = qpl_i
+        data_qubits[i] = data_i
+        magic_state_qubits[i] = magic_i
+        compilation_qubits[i] = comp_i
+        total_physical_qubits[i] = data_i + magic_i + comp_i
+        logical_gate_count[i] = lgc_i
+        physical_gate_count[i] = lgc_i * d_i ** 3
+        logical_error_rate[i] = p_L_i
+        if p_L_i < 1.0:
+            success_probability[i] = math.exp(lgc_i * math.log1p(-p_L_i))
+        else:
+            success_probability[i] = 0.0
+        wall_clock_time_us[i] = target_runtime[i] * (
+            (1.0 + d_i / 10.0) * (1.0 + mof[i] * 0.1) * 1.5
+        )
+
+
+# Compiled on first call (or loaded from numba's on-disk cache).
+# fastmath is left off: reassociated floating point could move the
+# ceil() in the code-distance formula and disagree with the scalar path.
+_sweep_kernel = (
+    njit(parallel=True, cache=True)(_sweep_loop) if njit is not None else None
+)
+
+
+def sweep_numba(
+    logical_qubits, target_runtime, p, p_L,
+    t_gate_count, mof, cof, physical_gate_time,
+):
+    """Numba-compiled resource formulas for DigitalResourceEstimator.sweep."""
+    if _sweep_kernel is None:
+        raise ImportError("backend='numba' requires numba to be installed")
+
+    shape = p.shape
+    # 1-D inputs, including zero-stride broadcast scalars, are passed as
+    # views; only N-d inputs are flattened (copying if not contiguous)
+    inputs = [
+        a if a.ndim == 1 else a.reshape(-1)
+        for a in (
+            logical_qubits, target_runtime, p, p_L,
+            t_gate_count, mof, cof, physical_gate_time,
+        )
+    ]
+    # Preallocated outputs, one array per quantity
+    outputs = [np.empty(p.size, dtype=np.int64) for _ in range(8)]
+    outputs += [np.empty(p.size, dtype=np.float64) for _ in range(3)]
+    _sweep_kernel(*inputs, *outputs)
+    return tuple(out.reshape(shape) for out in outputs)
@@ -8,12 +8,14 @@ The system T1 time is calculated as: 1/T1_system = sum(1/T1_i) for all qubits.
 This determines the maximum physical runtime before decoherence dominates.
 """
 
+import math
 import numpy as np
-from typing import Dict, Optional, List
-from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, Optional, Sequence
+from dataclasses import dataclass, asdict
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnalogSimulatorConfig:
     """Configuration for analog quantum simulator."""
     
@@ -21,7 +23,7 @@ class AnalogSimulatorConfig:
     circuit_width: int  # Number of qubits
     
     # T1 times (in microseconds)
-    qubit_t1_times: Optional[List[float]] = None  # Individual qubit T1 times
+    qubit_t1_times: Optional[Sequence[float]] = None  # Individual qubit T1 times
     default_t1: float = 100.0  # Default T1 time if not specified (μs)
     
     # Error rates (for analog operations)
@@ -34,14 +36,44 @@ class AnalogSimulatorConfig:
     max_runtime_multiplier: float = 1.0  # Safety factor for maximum runtime (fraction of T1)
     
     def __post_init__(self):
-        """Initialize qubit T1 times if not provided."""
+        """Validate individual qubit T1 times if provided."""
+        # None means every qubit has default_t1 (see t1_times)
         if self.qubit_t1_times is None:
-            self.qubit_t1_times = [self.default_t1] * self.circuit_width
-        elif len(self.qubit_t1_times) != self.circuit_width:
+            return
+        
+        if len(self.qubit_t1_times) != self.circuit_width:
             raise ValueError(
                 f"Number of T1 times ({len(self.qubit_t1_times)}) must match "
                 f"circuit width ({self.circuit_width})"
             )
+        
+        # Stored as a tuple so the frozen config stays hashable
+        object.__setattr__(self, 'qubit_t1_times', tuple(self.qubit_t1_times))
+    
+    @property
+    def t1_times(self) -> tuple:
+        """T1 time of each qubit in μs (default_t1 unless qubit_t1_times is set)."""
+        if self.qubit_t1_times is None:
+            return (self.default_t1,) * self.circuit_width
+        return self.qubit_t1_times
+
+
+@dataclass(slots=True, frozen=True)
+class AnalogSummary:
+    """Key metrics of an analog simulation (returned by AnalogSimulator.summary)."""
+    
+    circuit_width: int
+    system_t1_us: float
+    feasible_runtime_us: float
+    feasible_runtime_ms: float
+    feasible_runtime_s: float
+    fidelity: float
+    decoherence_error: float
+    total_error: float
+    
+    def to_dict(self) -> Dict:
+        """Return the summary as a plain dictionary."""
+        return asdict(self)
 
 
 class AnalogSimulator:
@@ -62,16 +94,13 @@ class AnalogSimulator:
             config: Configuration object with circuit and T1 parameters
         """
         self.config = config
-        self._system_t1 = None
-        self._feasible_runtime = None
         
-        # Calculate derived quantities
-        self._calculate_system_t1()
-        self._calculate_feasible_runtime()
+        # Derived quantities are cached properties, computed on first access
     
-    def _calculate_system_t1(self) -> float:
+    @cached_property
+    def system_t1(self) -> float:
         """
-        Calculate the effective system T1 time.
+        Effective system T1 time.
         
         The system T1 is determined by the parallel decoherence of all qubits:
         1/T1_system = sum(1/T1_i)
@@ -79,17 +108,30 @@ class AnalogSimulator:
         Returns:
             System T1 time in microseconds
         """
-        # Sum of reciprocals
-        reciprocal_sum = sum(1.0 / t1 for t1 in self.config.qubit_t1_times)
+        cfg = self.config
         
-        # System T1 is reciprocal of the sum
-        self._system_t1 = 1.0 / reciprocal_sum
+        if cfg.qubit_t1_times is None:
+            # Identical qubits: the sum collapses to N / T1
+            # (float() keeps derived values plain floats, e.g. for JSON reports,
+            # even if default_t1 is a numpy scalar)
+            return float(cfg.default_t1) / cfg.circuit_width
         
-        return self._system_t1
+        # Sum of reciprocals (as a Python float, as above)
+        t1_array = np.asarray(cfg.qubit_t1_times, dtype=np.float64)
+        reciprocal_sum = float(np.reciprocal(t1_array).sum())
+        
+        # System T1 is reciprocal of the sum
+        return 1.0 / reciprocal_sum
     
-    def _calculate_feasible_runtime(self) -> float:
+    @cached_property
+    def _inv_system_t1(self) -> float:
+        """Decay rate 1/T1_system, reused by the error calculations."""
+        return 1.0 / self.system_t1
+    
+    @cached_property
+    def feasible_runtime(self) -> float:
         """
-        Calculate the feasible runtime for the analog simulation.
+        Feasible runtime for the analog simulation.
         
         The runtime is constrained by the system T1 time. For analog simulation,
         we use a fraction of T1 to maintain acceptable fidelity.
@@ -99,9 +141,7 @@ class AnalogSimulator:
         """
         # Maximum usable time is a fraction of system T1
         # Typical choice: T1/2 to T1 depending on target fidelity
-        self._feasible_runtime = self._system_t1 * self.config.max_runtime_multiplier
-        
-        return self._feasible_runtime
+        return self.system_t1 * self.config.max_runtime_multiplier
     
     def get_decoherence_error(self, runtime: Optional[float] = None) -> float:
         """
@@ -114,10 +154,11 @@ class AnalogSimulator:
             Decoherence error probability
         """
         if runtime is None:
-            runtime = self._feasible_runtime
+            return self._feasible_decoherence_error
         
         # Error due to decoherence: 1 - exp(-t/T1)
-        decoherence_error = 1.0 - np.exp(-runtime / self._system_t1)
+        # expm1 keeps full precision when t << T1
+        decoherence_error = -math.expm1(-runtime * self._inv_system_t1)
         
         return decoherence_error
     
@@ -147,52 +188,48 @@ class AnalogSimulator:
         """
         return 1.0 - self.get_total_error(runtime)
     
-    # Public property accessors
-    @property
-    def system_t1(self) -> float:
-        """Get the effective system T1 time (μs)."""
-        return self._system_t1
-    
-    @property
-    def feasible_runtime(self) -> float:
-        """Get the feasible runtime (μs)."""
-        return self._feasible_runtime
+    @cached_property
+    def _feasible_decoherence_error(self) -> float:
+        """Decoherence error at the feasible runtime (computed once)."""
+        return -math.expm1(-self.feasible_runtime * self._inv_system_t1)
     
+    # Public property accessors
     @property
     def feasible_runtime_ms(self) -> float:
         """Get the feasible runtime in milliseconds."""
-        return self._feasible_runtime / 1000.0
+        return self.feasible_runtime / 1000.0
     
     @property
     def feasible_runtime_seconds(self) -> float:
         """Get the feasible runtime in seconds."""
-        return self._feasible_runtime / 1e6
+        return self.feasible_runtime / 1e6
     
-    def summary(self) -> Dict:
+    def summary(self) -> AnalogSummary:
         """
         Get a summary of the analog simulation parameters.
         
         Returns:
-            Dictionary containing key simulation metrics
+            AnalogSummary containing key simulation metrics
+            (use .to_dict() for a dictionary)
         """
-        return {
-            'circuit_width': self.config.circuit_width,
-            'system_t1_us': self._system_t1,
-            'feasible_runtime_us': self._feasible_runtime,
-            'feasible_runtime_ms': self.feasible_runtime_ms,
-            'feasible_runtime_s': self.feasible_runtime_seconds,
-            'fidelity': self.get_fidelity(),
-            'decoherence_error': self.get_decoherence_error(),
-            'total_error': self.get_total_error(),
-        }
+        return AnalogSummary(
+            circuit_width=self.config.circuit_width,
+            system_t1_us=self.system_t1,
+            feasible_runtime_us=self.feasible_runtime,
+            feasible_runtime_ms=self.feasible_runtime_ms,
+            feasible_runtime_s=self.feasible_runtime_seconds,
+            fidelity=self.get_fidelity(),
+            decoherence_error=self.get_decoherence_error(),
+            total_error=self.get_total_error(),
+        )
     
     def __repr__(self) -> str:
         """String representation of the simulator."""
         return (
             f"AnalogSimulator(\n"
             f"  circuit_width={self.config.circuit_width},\n"
-            f"  system_t1={self._system_t1:.2f} μs,\n"
-            f"  feasible_runtime={self._feasible_runtime:.2f} μs "
+            f"  system_t1={self.system_t1:.2f} μs,\n"
+            f"  feasible_runtime={self.feasible_runtime:.2f} μs "
             f"({self.feasible_runtime_ms:.2f} ms)\n"
             f")"
         )
@@ -12,12 +12,13 @@ Includes calculations for:
 - Space-time volume
 """
 
+import math
 import numpy as np
+from functools import cached_property
 from typing import Dict, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DigitalResourceConfig:
     """Configuration for digital resource estimation."""
     
@@ -49,17 +50,28 @@ class DigitalResourceConfig:
     
     def __post_init__(self):
         """Calculate derived parameters."""
+        # Frozen dataclass: derived fields are filled in via object.__setattr__
         if self.code_distance is None:
-            self.code_distance = self._calculate_code_distance()
+            object.__setattr__(
+                self, 'code_distance', self._calculate_code_distance()
+            )
         
         if self.qubits_per_logical is None:
-            self.qubits_per_logical = self._calculate_qubits_per_logical()
+            object.__setattr__(
+                self, 'qubits_per_logical', self._calculate_qubits_per_logical()
+            )
         
         if self.logical_gate_time is None:
-            self.logical_gate_time = self.code_distance * self.physical_gate_time
+            object.__setattr__(
+                self, 'logical_gate_time',
+                self.code_distance * self.physical_gate_time
+            )
         
         if self.error_correction_cycle_time is None:
-            self.error_correction_cycle_time = self.code_distance * self.physical_gate_time
+            object.__setattr__(
+                self, 'error_correction_cycle_time',
+                self.code_distance * self.physical_gate_time
+            )
     
     def _calculate_code_distance(self) -> int:
         """
@@ -83,17 +95,11 @@ class DigitalResourceConfig:
             )
         
         # Calculate distance needed
-        log_ratio = np.log(p_th / p)
-        d = int(np.ceil(2 * np.log(1.0 / p_L) / log_ratio))
+        log_ratio = math.log(p_th / p)
+        d = math.ceil(2 * math.log(1.0 / p_L) / log_ratio)
         
-        # Ensure odd distance (required for surface codes)
-        if d % 2 == 0:
-            d += 1
-        
-        # Minimum distance
-        d = max(d, 3)
-        
-        return d
+        # Minimum distance 3, forced odd (required for surface codes)
+        return max(d, 3) | 1
     
     def _calculate_qubits_per_logical(self) -> int:
         """
@@ -107,6 +113,93 @@ class DigitalResourceConfig:
         return 2 * self.code_distance ** 2
 
 
+@dataclass(slots=True, frozen=True)
+class DigitalSummary:
+    """Key resource metrics (returned by DigitalResourceEstimator.summary)."""
+    
+    logical_qubits: int
+    code_distance: int
+    qubits_per_logical: int
+    data_qubits: int
+    magic_state_qubits: int
+    compilation_qubits: int
+    total_physical_qubits: int
+    target_runtime_us: float
+    target_runtime_s: float
+    wall_clock_time_hours: float
+    wall_clock_time_seconds: float
+    wall_clock_time_us: float
+    logical_gate_count: int
+    physical_gate_count: int
+    space_time_volume_qubit_us: float
+    space_time_volume_qubit_s: float
+    logical_error_rate: float
+    algorithm_success_probability: float
+    physical_error_rate: float
+    
+    def to_dict(self) -> Dict:
+        """Return the summary as a plain dictionary."""
+        return asdict(self)
+
+
+def _sweep_numpy(
+    logical_qubits, target_runtime, p, p_L,
+    t_gate_count, mof, cof, physical_gate_time,
+):
+    """Vectorized resource formulas for DigitalResourceEstimator.sweep."""
+    p_th = 0.01  # Surface code threshold
+    
+    # Code distance: d ≈ 2 * log(1/p_L) / log(p_th/p), odd and at least 3
+    d = np.ceil(2 * np.log(1.0 / p_L) / np.log(p_th / p)).astype(np.int64)
+    d = np.maximum(d, 3) | 1
+    
+    qubits_per_logical = 2 * d * d
+    logical_gate_time = d * physical_gate_time
+    
+    # Qubit counts (same truncation as the per-instance properties)
+    data_qubits = logical_qubits * qubits_per_logical
+    magic_state_qubits = ((t_gate_count * qubits_per_logical) * mof).astype(np.int64)
+    compilation_qubits = (data_qubits * (cof - 1.0)).astype(np.int64)
+    total_physical_qubits = data_qubits + magic_state_qubits + compilation_qubits
+    
+    # Gate counts
+    logical_gate_count = (target_runtime / logical_gate_time).astype(np.int64)
+    physical_gate_count = logical_gate_count * d ** 3
+    
+    # Error rates
+    logical_error_rate = 0.1 * (p / p_th) ** ((d + 1) / 2)
+    # p_L >= 1 (not reachable below threshold) means certain failure
+    below_one = logical_error_rate < 1.0
+    success_probability = np.zeros_like(logical_error_rate)
+    success_probability[below_one] = np.exp(
+        logical_gate_count[below_one] * np.log1p(-logical_error_rate[below_one])
+    )
+    
+    # Wall-clock time with QEC overhead (see get_wall_clock_time)
+    qec_overhead_factor = (1.0 + d / 10.0) * (1.0 + mof * 0.1) * 1.5
+    wall_clock_time_us = target_runtime * qec_overhead_factor
+    
+    return (
+        d, qubits_per_logical, data_qubits, magic_state_qubits,
+        compilation_qubits, total_physical_qubits, logical_gate_count,
+        physical_gate_count, logical_error_rate, success_probability,
+        wall_clock_time_us,
+    )
+
+
+def _sweep_numba(*inputs):
+    """Numba-compiled resource formulas (imports numba on first use)."""
+    from library._numba_sweep import sweep_numba
+    return sweep_numba(*inputs)
+
+
+# Backends accepted by DigitalResourceEstimator.sweep
+_SWEEP_BACKENDS = {
+    'numpy': _sweep_numpy,
+    'numba': _sweep_numba,
+}
+
+
 class DigitalResourceEstimator:
     """
     Digital fault-tolerant quantum resource estimator.
@@ -124,54 +217,7 @@ class DigitalResourceEstimator:
         """
         self.config = config
         
-        # Calculate resources
-        self._data_qubits = None
-        self._magic_state_qubits = None
-        self._compilation_qubits = None
-        self._total_physical_qubits = None
-        self._space_time_volume = None
-        self._logical_gate_count = None
-        
-        self._calculate_resources()
-    
-    def _calculate_resources(self):
-        """Calculate all resource requirements."""
-        # Data qubits (logical qubits encoded in physical qubits)
-        self._data_qubits = (
-            self.config.logical_qubits * self.config.qubits_per_logical
-        )
-        
-        # Magic state cultivation qubits
-        # Needed for implementing non-Clifford gates (T gates)
-        self._magic_state_qubits = int(
-            self.config.t_gate_count * 
-            self.config.magic_state_overhead_factor *
-            self.config.qubits_per_logical
-        )
-        
-        # Compilation/routing overhead qubits
-        self._compilation_qubits = int(
-            self._data_qubits * 
-            (self.config.compilation_overhead_factor - 1.0)
-        )
-        
-        # Total physical qubits
-        self._total_physical_qubits = (
-            self._data_qubits + 
-            self._magic_state_qubits + 
-            self._compilation_qubits
-        )
-        
-        # Logical gate count estimate
-        # Based on runtime and logical gate time
-        self._logical_gate_count = int(
-            self.config.target_runtime / self.config.logical_gate_time
-        )
-        
-        # Space-time volume (qubit-microseconds)
-        self._space_time_volume = (
-            self._total_physical_qubits * self.config.target_runtime
-        )
+        # Derived resources are cached properties, computed on first access
     
     def get_logical_error_rate(self) -> float:
         """
@@ -180,15 +226,7 @@ class DigitalResourceEstimator:
         Returns:
             Logical error rate
         """
-        p = self.config.digital_error_rate
-        d = self.config.code_distance
-        p_th = 0.01  # Surface code threshold
-        
-        # Simplified logical error rate: p_L ≈ 0.1 * (p/p_th)^((d+1)/2)
-        exponent = (d + 1) / 2
-        p_L = 0.1 * (p / p_th) ** exponent
-        
-        return p_L
+        return self.logical_error_rate
     
     def get_algorithm_success_probability(self) -> float:
         """
@@ -197,11 +235,7 @@ class DigitalResourceEstimator:
         Returns:
             Success probability
         """
-        # Probability of no errors during logical gates
-        p_L = self.get_logical_error_rate()
-        p_success = (1.0 - p_L) ** self._logical_gate_count
-        
-        return p_success
+        return self.algorithm_success_probability
     
     def get_physical_gate_count(self) -> int:
         """
@@ -210,10 +244,7 @@ class DigitalResourceEstimator:
         Returns:
             Total physical gate count
         """
-        # Physical gates per logical gate ≈ O(d^3) for surface codes
-        physical_per_logical = self.config.code_distance ** 3
-        
-        return self._logical_gate_count * physical_per_logical
+        return self.physical_gate_count
     
     def get_wall_clock_time(self) -> float:
         """
@@ -279,7 +310,61 @@ class DigitalResourceEstimator:
         Returns:
             Wall-clock time in microseconds
         """
-        d = self.config.code_distance
+        return self.wall_clock_time_us
+    
+    def get_wall_clock_time_seconds(self) -> float:
+        """
+        Calculate wall-clock time in seconds.
+        
+        Returns:
+            Wall-clock time in seconds
+        """
+        return self.wall_clock_time_us / 1e6
+    
+    def get_wall_clock_time_hours(self) -> float:
+        """
+        Calculate wall-clock time in hours.
+        
+        Returns:
+            Wall-clock time in hours
+        """
+        return self.wall_clock_time_us / 3.6e9
+    
+    # Derived quantities, computed once on first access (config is fixed)
+    @cached_property
+    def logical_error_rate(self) -> float:
+        """Logical error rate achieved at the configured code distance."""
+        cfg = self.config
+        p = cfg.digital_error_rate
+        d = cfg.code_distance
+        p_th = 0.01  # Surface code threshold
+        
+        # Simplified logical error rate: p_L ≈ 0.1 * (p/p_th)^((d+1)/2)
+        exponent = (d + 1) / 2
+        p_L = 0.1 * (p / p_th) ** exponent
+        
+        return p_L
+    
+    @cached_property
+    def algorithm_success_probability(self) -> float:
+        """Probability that all logical gates execute without a logical error."""
+        # Probability of no errors during logical gates: (1 - p_L)^N,
+        # evaluated in log space so tiny p_L is not lost to rounding in 1 - p_L
+        p_L = self.logical_error_rate
+        
+        # An explicit code_distance above threshold can give p_L >= 1
+        if p_L >= 1.0:
+            return 0.0
+        
+        p_success = math.exp(self.logical_gate_count * math.log1p(-p_L))
+        
+        return p_success
+    
+    @cached_property
+    def _qec_overhead_factor(self) -> float:
+        """QEC wall-clock overhead multiplier (see get_wall_clock_time)."""
+        cfg = self.config
+        d = cfg.code_distance
         
         # 1. STABILIZATION OVERHEAD
         # Syndrome measurement requires rounds of measurement & decoding
@@ -287,111 +372,223 @@ class DigitalResourceEstimator:
         
         # 2. MAGIC STATE OVERHEAD
         # Non-Clifford gate preparation (T gate magic states)
-        magic_state_time_factor = 1.0 + (self.config.magic_state_overhead_factor * 0.1)
+        magic_state_time_factor = 1.0 + (cfg.magic_state_overhead_factor * 0.1)
         
         # 3. COMPILATION/TROTTER OVERHEAD
         # Circuit routing on 2D array + decomposition overhead
         trotter_overhead_factor = 1.5
         
         # TOTAL QEC OVERHEAD MULTIPLIER
-        qec_overhead_factor = (
+        return (
             stabilization_overhead * 
             magic_state_time_factor * 
             trotter_overhead_factor
         )
-        
-        # Wall-clock time = logical/simulation time × QEC overhead
-        wall_clock_us = self.config.target_runtime * qec_overhead_factor
-        
-        return wall_clock_us
     
-    def get_wall_clock_time_seconds(self) -> float:
-        """
-        Calculate wall-clock time in seconds.
-        
-        Returns:
-            Wall-clock time in seconds
-        """
-        return self.get_wall_clock_time() / 1e6
-    
-    def get_wall_clock_time_hours(self) -> float:
-        """
-        Calculate wall-clock time in hours.
-        
-        Returns:
-            Wall-clock time in hours
-        """
-        return self.get_wall_clock_time_seconds() / 3600.0
+    @cached_property
+    def wall_clock_time_us(self) -> float:
+        """Wall-clock time in microseconds (see get_wall_clock_time)."""
+        # Wall-clock time = logical/simulation time × QEC overhead
+        return self.config.target_runtime * self._qec_overhead_factor
     
     # Public property accessors
-    @property
+    @cached_property
     def data_qubits(self) -> int:
         """Number of physical qubits used for data (encoded logical qubits)."""
-        return self._data_qubits
+        # Logical qubits encoded in physical qubits
+        return self.config.logical_qubits * self.config.qubits_per_logical
     
-    @property
+    @cached_property
     def magic_state_qubits(self) -> int:
         """Number of physical qubits used for magic state cultivation."""
-        return self._magic_state_qubits
+        cfg = self.config
+        
+        # Needed for implementing non-Clifford gates (T gates)
+        # Integer product first, then a single float scaling and truncation
+        return int(
+            (cfg.t_gate_count * cfg.qubits_per_logical) *
+            cfg.magic_state_overhead_factor
+        )
     
-    @property
+    @cached_property
     def compilation_qubits(self) -> int:
         """Number of physical qubits used for compilation/routing overhead."""
-        return self._compilation_qubits
+        return int(
+            self.data_qubits * 
+            (self.config.compilation_overhead_factor - 1.0)
+        )
     
-    @property
+    @cached_property
     def total_physical_qubits(self) -> int:
         """Total number of physical qubits required."""
-        return self._total_physical_qubits
+        return (
+            self.data_qubits + 
+            self.magic_state_qubits + 
+            self.compilation_qubits
+        )
     
-    @property
+    @cached_property
     def space_time_volume(self) -> float:
         """Space-time volume in qubit-microseconds."""
-        return self._space_time_volume
+        return self.total_physical_qubits * self.config.target_runtime
     
     @property
     def space_time_volume_qubit_seconds(self) -> float:
         """Space-time volume in qubit-seconds."""
-        return self._space_time_volume / 1e6
+        return self.space_time_volume / 1e6
     
-    @property
+    @cached_property
     def logical_gate_count(self) -> int:
         """Number of logical gate operations."""
-        return self._logical_gate_count
+        cfg = self.config
+        
+        # Based on runtime and logical gate time
+        return int(cfg.target_runtime / cfg.logical_gate_time)
     
-    @property
-    def wall_clock_time_us(self) -> float:
-        """Wall-clock time in microseconds."""
-        return self.get_wall_clock_time()
+    @cached_property
+    def physical_gate_count(self) -> int:
+        """Number of physical gate operations."""
+        # Physical gates per logical gate ≈ O(d^3) for surface codes
+        return self.logical_gate_count * self.config.code_distance ** 3
     
-    def summary(self) -> Dict:
+    def summary(self) -> DigitalSummary:
         """
         Get a summary of the resource estimation.
         
         Returns:
-            Dictionary containing key resource metrics
+            DigitalSummary containing key resource metrics
+            (use .to_dict() for a dictionary)
+        """
+        return DigitalSummary(
+            logical_qubits=self.config.logical_qubits,
+            code_distance=self.config.code_distance,
+            qubits_per_logical=self.config.qubits_per_logical,
+            data_qubits=self.data_qubits,
+            magic_state_qubits=self.magic_state_qubits,
+            compilation_qubits=self.compilation_qubits,
+            total_physical_qubits=self.total_physical_qubits,
+            target_runtime_us=self.config.target_runtime,
+            target_runtime_s=self.config.target_runtime / 1e6,
+            wall_clock_time_hours=self.get_wall_clock_time_hours(),
+            wall_clock_time_seconds=self.get_wall_clock_time_seconds(),
+            wall_clock_time_us=self.get_wall_clock_time(),
+            logical_gate_count=self.logical_gate_count,
+            physical_gate_count=self.get_physical_gate_count(),
+            space_time_volume_qubit_us=self.space_time_volume,
+            space_time_volume_qubit_s=self.space_time_volume_qubit_seconds,
+            logical_error_rate=self.get_logical_error_rate(),
+            algorithm_success_probability=self.get_algorithm_success_probability(),
+            physical_error_rate=self.config.digital_error_rate,
+        )
+    
+    @classmethod
+    def sweep(
+        cls,
+        *,
+        logical_qubits,
+        target_runtime,
+        digital_error_rate,
+        target_logical_error_rate=1e-10,
+        t_gate_count=100,
+        magic_state_overhead_factor=2.0,
+        compilation_overhead_factor=1.5,
+        physical_gate_time=0.1,
+        backend: str = 'numpy',
+    ) -> Dict[str, np.ndarray]:
+        """
+        Estimate resources for many configurations at once.
+        
+        Vectorized equivalent of building one DigitalResourceConfig and
+        DigitalResourceEstimator per point, for parameter sweeps. All
+        arguments may be scalars or array-likes and are broadcast together;
+        code distance, qubits per logical qubit and logical gate time are
+        always auto-calculated.
+        
+        Args:
+            logical_qubits: Number of logical qubits needed
+            target_runtime: Target runtime in microseconds
+            digital_error_rate: Physical qubit error rate (per gate)
+            target_logical_error_rate: Target logical error rate
+            t_gate_count: Estimated number of T gates
+            magic_state_overhead_factor: Overhead factor for magic state cultivation
+            compilation_overhead_factor: Extra qubits for routing/compilation
+            physical_gate_time: Physical gate time in microseconds
+            backend: 'numpy' (default) or 'numba'. The numba backend needs
+                numba installed and may differ from numpy in the last few
+                ulp of float outputs; it is only worth trying on
+                multi-core machines, so it is never chosen automatically.
+            
+        Returns:
+            Dictionary of arrays keyed like the DigitalSummary fields,
+            one entry per point (0-d arrays for scalar inputs)
         """
-        return {
-            'logical_qubits': self.config.logical_qubits,
-            'code_distance': self.config.code_distance,
-            'qubits_per_logical': self.config.qubits_per_logical,
-            'data_qubits': self._data_qubits,
-            'magic_state_qubits': self._magic_state_qubits,
-            'compilation_qubits': self._compilation_qubits,
-            'total_physical_qubits': self._total_physical_qubits,
-            'target_runtime_us': self.config.target_runtime,
-            'target_runtime_s': self.config.target_runtime / 1e6,
-            'wall_clock_time_hours': self.get_wall_clock_time_hours(),
-            'wall_clock_time_seconds': self.get_wall_clock_time_seconds(),
-            'wall_clock_time_us': self.get_wall_clock_time(),
-            'logical_gate_count': self._logical_gate_count,
-            'physical_gate_count': self.get_physical_gate_count(),
-            'space_time_volume_qubit_us': self._space_time_volume,
-            'space_time_volume_qubit_s': self.space_time_volume_qubit_seconds,
-            'logical_error_rate': self.get_logical_error_rate(),
-            'algorithm_success_probability': self.get_algorithm_success_probability(),
-            'physical_error_rate': self.config.digital_error_rate,
+        if backend not in _SWEEP_BACKENDS:
+            raise ValueError(
+                f"Unknown sweep backend {backend!r}; "
+                f"expected one of {sorted(_SWEEP_BACKENDS)}"
+            )
+        
+        inputs = (
+            np.asarray(logical_qubits, dtype=np.int64),
+            np.asarray(target_runtime, dtype=np.float64),
+            np.asarray(digital_error_rate, dtype=np.float64),
+            np.asarray(target_logical_error_rate, dtype=np.float64),
+            np.asarray(t_gate_count, dtype=np.int64),
+            np.asarray(magic_state_overhead_factor, dtype=np.float64),
+            np.asarray(compilation_overhead_factor, dtype=np.float64),
+            np.asarray(physical_gate_time, dtype=np.float64),
+        )
+        # Read-only broadcast views: scalar inputs are not expanded in memory
+        shape = np.broadcast_shapes(*(a.shape for a in inputs))
+        (
+            logical_qubits, target_runtime, p, p_L,
+            t_gate_count, mof, cof, physical_gate_time,
+        ) = (np.broadcast_to(a, shape) for a in inputs)
+        p_th = 0.01  # Surface code threshold
+        
+        if np.any(p >= p_th):
+            raise ValueError(
+                f"Physical error rate ({p.max()}) must be below threshold ({p_th})"
+            )
+        
+        (
+            d, qubits_per_logical, data_qubits, magic_state_qubits,
+            compilation_qubits, total_physical_qubits, logical_gate_count,
+            physical_gate_count, logical_error_rate, success_probability,
+            wall_clock_time_us,
+        ) = _SWEEP_BACKENDS[backend](
+            logical_qubits, target_runtime, p, p_L,
+            t_gate_count, mof, cof, physical_gate_time,
+        )
+        
+        space_time_volume = total_physical_qubits * target_runtime
+        
+        result = {
+            # Inputs are copied: the broadcast views are read-only and may
+            # alias the caller's arrays
+            'logical_qubits': logical_qubits.copy(),
+            'code_distance': d,
+            'qubits_per_logical': qubits_per_logical,
+            'data_qubits': data_qubits,
+            'magic_state_qubits': magic_state_qubits,
+            'compilation_qubits': compilation_qubits,
+            'total_physical_qubits': total_physical_qubits,
+            'target_runtime_us': target_runtime.copy(),
+            'target_runtime_s': target_runtime / 1e6,
+            'wall_clock_time_hours': wall_clock_time_us / 3.6e9,
+            'wall_clock_time_seconds': wall_clock_time_us / 1e6,
+            'wall_clock_time_us': wall_clock_time_us,
+            'logical_gate_count': logical_gate_count,
+            'physical_gate_count': physical_gate_count,
+            'space_time_volume_qubit_us': space_time_volume,
+            'space_time_volume_qubit_s': space_time_volume / 1e6,
+            'logical_error_rate': logical_error_rate,
+            'algorithm_success_probability': success_probability,
+            'physical_error_rate': p.copy(),
         }
+        
+        # Arrays throughout, also for scalar inputs (0-d arrays)
+        return {key: np.asarray(value) for key, value in result.items()}
     
     def __repr__(self) -> str:
         """String representation of the estimator."""
@@ -399,9 +596,9 @@ class DigitalResourceEstimator:
             f"DigitalResourceEstimator(\n"
             f"  logical_qubits={self.config.logical_qubits},\n"
             f"  code_distance={self.config.code_distance},\n"
-            f"  total_physical_qubits={self._total_physical_qubits:,},\n"
+            f"  total_physical_qubits={self.total_physical_qubits:,},\n"
             f"  runtime={self.config.target_runtime:.2e} μs "
             f"({self.get_wall_clock_time_hours():.2f} hours),\n"
-            f"  space_time_volume={self._space_time_volume:.2e} qubit-μs\n"
+            f"  space_time_volume={self.space_time_volume:.2e} qubit-μs\n"
             f")"
         )
@@ -6,12 +6,194 @@ analog and digital quantum computing resource requirements.
 """
 
 from typing import Dict, Optional, Union
+import copy
 import json
-from datetime import datetime
+from functools import cached_property
+from time import gmtime, strftime
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 from library.analog_simulator import AnalogSimulator
 from library.digital_resource_estimator import DigitalResourceEstimator
 
 
+class ComparisonReport:
+    """
+    Comparison report between analog and digital approaches.
+    
+    Each report section is computed on first access, so callers that only
+    need part of the report (e.g. just the comparison) skip the rest.
+    """
+    
+    def __init__(
+        self,
+        analog_sim: AnalogSimulator,
+        digital_est: DigitalResourceEstimator,
+        title: str = "Quantum Resource Estimation Report",
+        include_metadata: bool = True
+    ):
+        """
+        Initialize the report.
+        
+        Args:
+            analog_sim: AnalogSimulator instance
+            digital_est: DigitalResourceEstimator instance
+            title: Report title
+            include_metadata: Whether to include metadata (timestamp, etc.)
+        """
+        self.analog_sim = analog_sim
+        self.digital_est = digital_est
+        self.title = title
+        self.include_metadata = include_metadata
+    
+    @cached_property
+    def metadata(self) -> Dict:
+        """Report metadata (generation timestamp and version)."""
+        return {
+            'generated_at': strftime('%Y-%m-%dT%H:%M:%SZ', gmtime()),
+            'version': '1.0.0'
+        }
+    
+    @cached_property
+    def analog_simulation(self) -> Dict:
+        """Analog simulation section."""
+        analog_sim = self.analog_sim
+        
+        return {
+            'circuit_configuration': {
+                'width': analog_sim.config.circuit_width,
+                'individual_t1_times_us': analog_sim.config.t1_times,
+                'measurement_error_rate': analog_sim.config.measurement_error_rate,
+            },
+            'system_performance': {
+                'system_t1_us': analog_sim.system_t1,
+                'feasible_runtime_us': analog_sim.feasible_runtime,
+                'feasible_runtime_ms': analog_sim.feasible_runtime_ms,
+                'feasible_runtime_s': analog_sim.feasible_runtime_seconds,
+            },
+            'error_analysis': {
+                'decoherence_error': analog_sim.get_decoherence_error(),
+                'total_error': analog_sim.get_total_error(),
+                'fidelity': analog_sim.get_fidelity(),
+            }
+        }
+    
+    @cached_property
+    def digital_fault_tolerant(self) -> Dict:
+        """Digital resource estimation section."""
+        digital_est = self.digital_est
+        tgt_rt = digital_est.config.target_runtime
+        
+        return {
+            'logical_configuration': {
+                'logical_qubits': digital_est.config.logical_qubits,
+                'target_runtime_us': tgt_rt,
+                'target_runtime_s': tgt_rt / 1e6,
+                'physical_error_rate': digital_est.config.digital_error_rate,
+                'target_logical_error_rate': digital_est.config.target_logical_error_rate,
+            },
+            'error_correction': {
+                'code_distance': digital_est.config.code_distance,
+                'physical_qubits_per_logical': digital_est.config.qubits_per_logical,
+                'logical_gate_time_us': digital_est.config.logical_gate_time,
+                'achieved_logical_error_rate': digital_est.get_logical_error_rate(),
+            },
+            'resource_breakdown': {
+                'data_qubits': digital_est.data_qubits,
+                'magic_state_qubits': digital_est.magic_state_qubits,
+                'compilation_qubits': digital_est.compilation_qubits,
+                'total_physical_qubits': digital_est.total_physical_qubits,
+            },
+            'performance_metrics': {
+                'logical_gate_count': digital_est.logical_gate_count,
+                'physical_gate_count': digital_est.get_physical_gate_count(),
+                'target_runtime_us': tgt_rt,
+                'wall_clock_time_us': digital_est.get_wall_clock_time(),
+                'wall_clock_time_seconds': digital_est.get_wall_clock_time_seconds(),
+                'wall_clock_time_hours': digital_est.get_wall_clock_time_hours(),
+                'space_time_volume_qubit_us': digital_est.space_time_volume,
+                'space_time_volume_qubit_s': digital_est.space_time_volume_qubit_seconds,
+                'algorithm_success_probability': (
+                    digital_est.get_algorithm_success_probability()
+                ),
+            }
+        }
+    
+    @cached_property
+    def comparison(self) -> Dict:
+        """Comparison section (digital relative to analog)."""
+        width = self.analog_sim.config.circuit_width
+        stv_s = self.digital_est.space_time_volume_qubit_seconds
+        
+        runtime_ratio = (
+            self.digital_est.config.target_runtime / self.analog_sim.feasible_runtime
+        )
+        analog_qubit_seconds = width * self.analog_sim.feasible_runtime_seconds
+        
+        return {
+            'qubit_count_ratio': self.digital_est.total_physical_qubits / width,
+            'runtime_ratio_digital_to_analog': runtime_ratio,
+            'analog_faster': runtime_ratio > 1,
+            'space_time_advantage': {
+                'analog_qubit_seconds': analog_qubit_seconds,
+                'digital_qubit_seconds': stv_s,
+                'ratio': stv_s / analog_qubit_seconds
+            }
+        }
+    
+    @cached_property
+    def _report(self) -> Dict:
+        """The full report dictionary, materialized once."""
+        report = {
+            'title': self.title,
+        }
+        
+        if self.include_metadata:
+            report['metadata'] = self.metadata
+        
+        report['analog_simulation'] = self.analog_simulation
+        report['digital_fault_tolerant'] = self.digital_fault_tolerant
+        report['comparison'] = self.comparison
+        
+        return report
+    
+    @cached_property
+    def _table(self) -> str:
+        """The rendered text table, formatted once."""
+        # Shallow copy so the '_rendered' cache entry stays out of _report
+        return format_report_table(dict(self._report))
+    
+    def to_dict(self) -> Dict:
+        """
+        Materialize the full report.
+        
+        Returns:
+            Dictionary in the layout returned by generate_comparison_report();
+            a copy, so changes to it do not affect this report
+        """
+        return copy.deepcopy(self._report)
+    
+    def to_json(self, filename: str, pretty: bool = False):
+        """
+        Save the report to a JSON file (see save_report_json).
+        
+        Args:
+            filename: Output filename
+            pretty: Indent the JSON by two spaces
+        """
+        save_report_json(self._report, filename, pretty=pretty)
+    
+    def format_table(self) -> str:
+        """
+        Format the report as a text table (see format_report_table).
+        
+        Returns:
+            Formatted string table
+        """
+        return self._table
+
+
 def generate_comparison_report(
     analog_sim: AnalogSimulator,
     digital_est: DigitalResourceEstimator,
@@ -30,187 +212,179 @@ def generate_comparison_report(
     Returns:
         Dictionary containing the full report
     """
-    report = {
-        'title': title,
-    }
-    
-    if include_metadata:
-        report['metadata'] = {
-            'generated_at': datetime.now().isoformat(),
-            'version': '1.0.0'
-        }
-    
-    # Analog simulation section
-    report['analog_simulation'] = {
-        'circuit_configuration': {
-            'width': analog_sim.config.circuit_width,
-            'individual_t1_times_us': analog_sim.config.qubit_t1_times,
-            'measurement_error_rate': analog_sim.config.measurement_error_rate,
-        },
-        'system_performance': {
-            'system_t1_us': round(analog_sim.system_t1, 4),
-            'feasible_runtime_us': round(analog_sim.feasible_runtime, 4),
-            'feasible_runtime_ms': round(analog_sim.feasible_runtime_ms, 4),
-            'feasible_runtime_s': round(analog_sim.feasible_runtime_seconds, 6),
-        },
-        'error_analysis': {
-            'decoherence_error': round(analog_sim.get_decoherence_error(), 6),
-            'total_error': round(analog_sim.get_total_error(), 6),
-            'fidelity': round(analog_sim.get_fidelity(), 6),
-        }
-    }
-    
-    # Digital resource estimation section
-    report['digital_fault_tolerant'] = {
-        'logical_configuration': {
-            'logical_qubits': digital_est.config.logical_qubits,
-            'target_runtime_us': digital_est.config.target_runtime,
-            'target_runtime_s': round(digital_est.config.target_runtime / 1e6, 6),
-            'physical_error_rate': digital_est.config.digital_error_rate,
-            'target_logical_error_rate': digital_est.config.target_logical_error_rate,
-        },
-        'error_correction': {
-            'code_distance': digital_est.config.code_distance,
-            'physical_qubits_per_logical': digital_est.config.qubits_per_logical,
-            'logical_gate_time_us': digital_est.config.logical_gate_time,
-            'achieved_logical_error_rate': f"{digital_est.get_logical_error_rate():.2e}",
-        },
-        'resource_breakdown': {
-            'data_qubits': digital_est.data_qubits,
-            'magic_state_qubits': digital_est.magic_state_qubits,
-            'compilation_qubits': digital_est.compilation_qubits,
-            'total_physical_qubits': digital_est.total_physical_qubits,
-        },
-        'performance_metrics': {
-            'logical_gate_count': digital_est.logical_gate_count,
-            'physical_gate_count': digital_est.get_physical_gate_count(),
-            'target_runtime_us': digital_est.config.target_runtime,
-            'wall_clock_time_us': round(digital_est.get_wall_clock_time(), 2),
-            'wall_clock_time_seconds': round(digital_est.get_wall_clock_time_seconds(), 6),
-            'wall_clock_time_hours': round(digital_est.get_wall_clock_time_hours(), 4),
-            'space_time_volume_qubit_us': f"{digital_est.space_time_volume:.2e}",
-            'space_time_volume_qubit_s': f"{digital_est.space_time_volume_qubit_seconds:.2e}",
-            'algorithm_success_probability': round(
-                digital_est.get_algorithm_success_probability(), 6
-            ),
-        }
-    }
-    
-    # Comparison section
-    runtime_ratio = (
-        digital_est.config.target_runtime / analog_sim.feasible_runtime
-    )
-    
-    report['comparison'] = {
-        'qubit_count_ratio': round(
-            digital_est.total_physical_qubits / analog_sim.config.circuit_width, 2
-        ),
-        'runtime_ratio_digital_to_analog': round(runtime_ratio, 2),
-        'analog_faster': runtime_ratio > 1,
-        'space_time_advantage': {
-            'analog_qubit_seconds': round(
-                analog_sim.config.circuit_width * analog_sim.feasible_runtime_seconds, 2
-            ),
-            'digital_qubit_seconds': round(
-                digital_est.space_time_volume_qubit_seconds, 2
-            ),
-            'ratio': round(
-                digital_est.space_time_volume_qubit_seconds / 
-                (analog_sim.config.circuit_width * analog_sim.feasible_runtime_seconds),
-                2
-            )
-        }
-    }
-    
-    return report
+    # The report object is discarded, so its dictionary needs no copy
+    return ComparisonReport(
+        analog_sim, digital_est, title=title, include_metadata=include_metadata
+    )._report
+
+
+# Text layout for format_report_table, filled with a single format_map call.
+# {metadata} is either empty or the "Generated:" line plus a separator.
+_REPORT_TEMPLATE = """\
+{rule}
+{title:^80}
+{rule}
+{metadata}
+ANALOG SIMULATION
+{sep}
+System Size:            {width} qubits
+System T1:              {system_t1_us:.2f} μs
+Feasible Runtime:       {feasible_runtime_ms:.2f} ms
+                        ({feasible_runtime_s:.6f} s)
+Fidelity:               {fidelity:.4f}
+Total Error:            {total_error:.6f}
+
+DIGITAL FAULT-TOLERANT COMPUTATION
+{sep}
+Logical Qubits:         {logical_qubits}
+Code Distance:          {code_distance}
+Physical Qubits/Logical:{qubits_per_logical}
 
+Resource Breakdown:
+  Data Qubits:          {data_qubits:,}
+  Magic State  Qubits:  {magic_state_qubits:,}
+  Compilation Qubits:   {compilation_qubits:,}
+  TOTAL Physical Qubits:{total_physical_qubits:,}
 
-def format_report_table(report: Dict) -> str:
+Target Runtime:         {target_runtime_s:.6f} s ({target_runtime_us:.2f} μs)
+Wall Clock Time:        {wall_clock_time_us:.2f} μs
+                        {wall_clock_time_seconds:.6f} s
+                        {wall_clock_time_hours:.4f} hours
+Logical Gates:          {logical_gate_count:,}
+Space-Time Volume:      {space_time_volume_qubit_s:.2e} qubit-s
+Success Probability:    {success_probability:.4f}
+
+COMPARISON
+{sep}
+Qubit Count Ratio (D/A):{qubit_count_ratio:.2f}x
+Runtime Ratio (D/A):    {runtime_ratio:.2f}x
+{verdict}
+
+Space-Time Resources:
+  Analog:  {analog_qubit_seconds:.2e} qubit-s
+  Digital: {digital_qubit_seconds:.2e} qubit-s
+  Ratio:   {space_time_ratio:.2e}x
+{rule}""".replace("{rule}", "=" * 80).replace("{sep}", "-" * 80)
+
+_ANALOG_FASTER_TEMPLATE = _REPORT_TEMPLATE.replace(
+    "{verdict}", "→ Analog simulation is {runtime_ratio:.2f}x FASTER"
+)
+_DIGITAL_FASTER_TEMPLATE = _REPORT_TEMPLATE.replace(
+    "{verdict}", "→ Digital computation is {digital_speedup:.2f}x FASTER"
+)
+
+
+def format_report_table(report: Dict, force: bool = False) -> str:
     """
     Format the report as a text table similar to the PDF format.
     
+    The rendered table is cached on the report under '_rendered', so printing
+    and saving the same report only formats it once.
+    
     Args:
         report: Report dictionary from generate_comparison_report()
+        force: Re-render even if a cached table exists (e.g. after editing the report)
         
     Returns:
         Formatted string table
     """
+    if not force and '_rendered' in report:
+        return report['_rendered']
+    
     analog = report['analog_simulation']
     digital = report['digital_fault_tolerant']
     comparison = report['comparison']
     
-    lines = []
-    lines.append("=" * 80)
-    lines.append(f"{report['title']:^80}")
-    lines.append("=" * 80)
+    cc = analog['circuit_configuration']
+    sp = analog['system_performance']
+    ea = analog['error_analysis']
+    lc = digital['logical_configuration']
+    ec = digital['error_correction']
+    rb = digital['resource_breakdown']
+    pm = digital['performance_metrics']
+    sta = comparison['space_time_advantage']
     
     if 'metadata' in report:
-        lines.append(f"Generated: {report['metadata']['generated_at']}")
-        lines.append("-" * 80)
-    
-    lines.append("")
-    lines.append("ANALOG SIMULATION")
-    lines.append("-" * 80)
-    lines.append(f"System Size:            {analog['circuit_configuration']['width']} qubits")
-    lines.append(f"System T1:              {analog['system_performance']['system_t1_us']:.2f} μs")
-    lines.append(f"Feasible Runtime:       {analog['system_performance']['feasible_runtime_ms']:.2f} ms")
-    lines.append(f"                        ({analog['system_performance']['feasible_runtime_s']:.6f} s)")
-    lines.append(f"Fidelity:               {analog['error_analysis']['fidelity']:.4f}")
-    lines.append(f"Total Error:            {analog['error_analysis']['total_error']:.6f}")
-    
-    lines.append("")
-    lines.append("DIGITAL FAULT-TOLERANT COMPUTATION")
-    lines.append("-" * 80)
-    lines.append(f"Logical Qubits:         {digital['logical_configuration']['logical_qubits']}")
-    lines.append(f"Code Distance:          {digital['error_correction']['code_distance']}")
-    lines.append(f"Physical Qubits/Logical:{digital['error_correction']['physical_qubits_per_logical']}")
-    lines.append("")
-    lines.append("Resource Breakdown:")
-    lines.append(f"  Data Qubits:          {digital['resource_breakdown']['data_qubits']:,}")
-    lines.append(f"  Magic State  Qubits:  {digital['resource_breakdown']['magic_state_qubits']:,}")
-    lines.append(f"  Compilation Qubits:   {digital['resource_breakdown']['compilation_qubits']:,}")
-    lines.append(f"  TOTAL Physical Qubits:{digital['resource_breakdown']['total_physical_qubits']:,}")
-    lines.append("")
-    lines.append(f"Target Runtime:         {digital['logical_configuration']['target_runtime_s']:.6f} s ({digital['logical_configuration']['target_runtime_us']:.2f} μs)")
-    lines.append(f"Wall Clock Time:        {digital['performance_metrics']['wall_clock_time_us']:.2f} μs")
-    lines.append(f"                        {digital['performance_metrics']['wall_clock_time_seconds']:.6f} s")
-    lines.append(f"                        {digital['performance_metrics']['wall_clock_time_hours']:.4f} hours")
-    lines.append(f"Logical Gates:          {digital['performance_metrics']['logical_gate_count']:,}")
-    lines.append(f"Space-Time Volume:      {digital['performance_metrics']['space_time_volume_qubit_s']} qubit-s")
-    lines.append(f"Success Probability:    {digital['performance_metrics']['algorithm_success_probability']:.4f}")
-    
-    lines.append("")
-    lines.append("COMPARISON")
-    lines.append("-" * 80)
-    lines.append(f"Qubit Count Ratio (D/A):{comparison['qubit_count_ratio']:.2f}x")
-    lines.append(f"Runtime Ratio (D/A):    {comparison['runtime_ratio_digital_to_analog']:.2f}x")
+        metadata = (
+            f"Generated: {report['metadata']['generated_at']}\n{'-' * 80}\n"
+        )
+    else:
+        metadata = ""
+    
+    flat = {
+        'title': report['title'],
+        'metadata': metadata,
+        'width': cc['width'],
+        'system_t1_us': sp['system_t1_us'],
+        'feasible_runtime_ms': sp['feasible_runtime_ms'],
+        'feasible_runtime_s': sp['feasible_runtime_s'],
+        'fidelity': ea['fidelity'],
+        'total_error': ea['total_error'],
+        'logical_qubits': lc['logical_qubits'],
+        'code_distance': ec['code_distance'],
+        'qubits_per_logical': ec['physical_qubits_per_logical'],
+        'data_qubits': rb['data_qubits'],
+        'magic_state_qubits': rb['magic_state_qubits'],
+        'compilation_qubits': rb['compilation_qubits'],
+        'total_physical_qubits': rb['total_physical_qubits'],
+        'target_runtime_s': lc['target_runtime_s'],
+        'target_runtime_us': lc['target_runtime_us'],
+        'wall_clock_time_us': pm['wall_clock_time_us'],
+        'wall_clock_time_seconds': pm['wall_clock_time_seconds'],
+        'wall_clock_time_hours': pm['wall_clock_time_hours'],
+        'logical_gate_count': pm['logical_gate_count'],
+        'space_time_volume_qubit_s': pm['space_time_volume_qubit_s'],
+        'success_probability': pm['algorithm_success_probability'],
+        'qubit_count_ratio': comparison['qubit_count_ratio'],
+        'runtime_ratio': comparison['runtime_ratio_digital_to_analog'],
+        'analog_qubit_seconds': sta['analog_qubit_seconds'],
+        'digital_qubit_seconds': sta['digital_qubit_seconds'],
+        'space_time_ratio': sta['ratio'],
+    }
     
     if comparison['analog_faster']:
-        lines.append(f"→ Analog simulation is {comparison['runtime_ratio_digital_to_analog']:.2f}x FASTER")
+        template = _ANALOG_FASTER_TEMPLATE
     else:
-        lines.append(f"→ Digital computation is {1/comparison['runtime_ratio_digital_to_analog']:.2f}x FASTER")
+        template = _DIGITAL_FASTER_TEMPLATE
+        flat['digital_speedup'] = 1 / flat['runtime_ratio']
     
-    lines.append("")
-    lines.append("Space-Time Resources:")
-    lines.append(f"  Analog:  {comparison['space_time_advantage']['analog_qubit_seconds']:.2e} qubit-s")
-    lines.append(f"  Digital: {comparison['space_time_advantage']['digital_qubit_seconds']:.2e} qubit-s")
-    lines.append(f"  Ratio:   {comparison['space_time_advantage']['ratio']:.2e}x")
+    table = template.format_map(flat)
+    report['_rendered'] = table
     
-    lines.append("=" * 80)
-    
-    return "\n".join(lines)
+    return table
 
 
-def save_report_json(report: Dict, filename: str):
+def save_report_json(report: Dict, filename: str, pretty: bool = False):
     """
     Save the report to a JSON file.
     
+    The report is serialized in one shot and written with a single call.
+    Output is compact by default; use pretty=True for indented JSON.
+    
     Args:
         report: Report dictionary
         filename: Output filename
+        pretty: Indent the JSON by two spaces
     """
-    with open(filename, 'w') as f:
-        json.dump(report, f, indent=2)
+    # Leave out the cached text table from format_report_table
+    if '_rendered' in report:
+        report = {k: v for k, v in report.items() if k != '_rendered'}
+    
+    if orjson is not None:
+        # Inputs may be numpy scalars (e.g. error rates from np.logspace),
+        # which the stdlib encoder accepts as float subclasses
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        data = orjson.dumps(report, option=option)
+    elif pretty:
+        data = json.dumps(report, indent=2).encode()
+    else:
+        # Compact separators only make the output smaller
+        data = json.dumps(report, separators=(',', ':')).encode()
+    
+    with open(filename, 'wb') as f:
+        f.write(data)
     
     print(f"Report saved to {filename}")
 
@@ -0,0 +1,43 @@
+"""Tests for AnalogSimulatorConfig and AnalogSimulator."""
+
+from dataclasses import asdict, replace
+
+import pytest
+
+from library.analog_simulator import AnalogSimulator, AnalogSimulatorConfig
+
+
+def test_uniform_config_derives_t1_times():
+    config = AnalogSimulatorConfig(circuit_width=4, default_t1=50.0)
+
+    assert config.qubit_t1_times is None
+    assert config.t1_times == (50.0,) * 4
+    assert AnalogSimulator(config).system_t1 == 12.5
+
+
+def test_replace_recomputes_uniform_t1():
+    config = AnalogSimulatorConfig(circuit_width=4)
+
+    assert AnalogSimulator(replace(config, default_t1=50.0)).system_t1 == 12.5
+    widened = replace(config, circuit_width=8)
+    assert widened.t1_times == (100.0,) * 8
+    assert AnalogSimulator(widened).system_t1 == 12.5
+
+
+def test_individual_t1_times():
+    config = AnalogSimulatorConfig(circuit_width=2, qubit_t1_times=[50.0, 50.0])
+
+    assert config.qubit_t1_times == (50.0, 50.0)
+    assert config.t1_times == (50.0, 50.0)
+    assert AnalogSimulator(config).system_t1 == 25.0
+    with pytest.raises(ValueError):
+        replace(config, circuit_width=3)
+
+
+def test_asdict_has_only_init_fields():
+    config = AnalogSimulatorConfig(circuit_width=4)
+
+    assert set(asdict(config)) == {
+        'circuit_width', 'qubit_t1_times', 'default_t1',
+        'measurement_error_rate', 'target_fidelity', 'max_runtime_multiplier',
+    }
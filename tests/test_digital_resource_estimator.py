@@ -0,0 +1,124 @@
+"""Tests for the vectorized DigitalResourceEstimator.sweep backends."""
+
+import numpy as np
+import pytest
+
+from library import digital_resource_estimator as dre
+from library.digital_resource_estimator import (
+    DigitalResourceConfig,
+    DigitalResourceEstimator,
+)
+
+
+def _sweep_inputs(n=20_000, seed=0):
+    rng = np.random.default_rng(seed)
+    return (
+        rng.integers(1, 500, n),
+        rng.uniform(0.1, 1e8, n),
+        rng.uniform(1e-7, 9e-3, n),
+        10.0 ** rng.uniform(-15, -3, n),
+        rng.integers(0, 1000, n),
+        rng.uniform(1.0, 4.0, n),
+        rng.uniform(1.0, 2.0, n),
+        rng.uniform(0.01, 1.0, n),
+    )
+
+
+def test_sweep_numba_matches_numpy():
+    pytest.importorskip("numba")
+    inputs = _sweep_inputs()
+    expected = dre._sweep_numpy(*inputs)
+    actual = dre._sweep_numba(*inputs)
+
+    for exp, act in zip(expected, actual):
+        if exp.dtype.kind == 'i':
+            np.testing.assert_array_equal(act, exp)
+        else:
+            np.testing.assert_allclose(act, exp, rtol=1e-12, atol=0)
+
+
+def test_sweep_numba_matches_numpy_for_broadcast_inputs():
+    pytest.importorskip("numba")
+    shape = (3, 7)
+    inputs = [
+        np.broadcast_to(a, shape)
+        for a in (
+            np.array([[1], [50], [200]]),
+            np.array([[0.5], [1e3], [1e6]]),
+            np.logspace(-6, -2.1, 7),
+            np.array(1e-10),
+            np.array(100),
+            np.array(2.0),
+            np.array(1.5),
+            np.array(0.1),
+        )
+    ]
+    expected = dre._sweep_numpy(*inputs)
+    actual = dre._sweep_numba(*inputs)
+
+    for exp, act in zip(expected, actual):
+        assert act.shape == exp.shape
+        np.testing.assert_allclose(act, exp, rtol=1e-12, atol=0)
+
+
+def test_sweep_matches_estimator():
+    error_rates = np.logspace(-6, -2.1, 9)
+    result = DigitalResourceEstimator.sweep(
+        logical_qubits=50,
+        target_runtime=1e6,
+        digital_error_rate=error_rates,
+        magic_state_overhead_factor=2.3,
+    )
+
+    for i, p in enumerate(error_rates):
+        summary = DigitalResourceEstimator(DigitalResourceConfig(
+            logical_qubits=50,
+            target_runtime=1e6,
+            digital_error_rate=float(p),
+            magic_state_overhead_factor=2.3,
+        )).summary().to_dict()
+        for key, value in summary.items():
+            assert result[key][i] == pytest.approx(value, rel=1e-12)
+
+
+def test_sweep_scalar_inputs_return_0d_arrays():
+    result = DigitalResourceEstimator.sweep(
+        logical_qubits=10, target_runtime=100.0, digital_error_rate=1e-3
+    )
+
+    for value in result.values():
+        assert isinstance(value, np.ndarray)
+        assert value.shape == ()
+
+
+def test_sweep_numba_backend_matches_numpy_backend():
+    pytest.importorskip("numba")
+    error_rates = np.logspace(-6, -2.1, 9)
+    kwargs = dict(logical_qubits=50, target_runtime=1e6,
+                  digital_error_rate=error_rates)
+    expected = DigitalResourceEstimator.sweep(**kwargs)
+    actual = DigitalResourceEstimator.sweep(**kwargs, backend="numba")
+
+    for key, value in expected.items():
+        np.testing.assert_allclose(actual[key], value, rtol=1e-12, atol=0)
+
+
+def test_sweep_rejects_unknown_backend():
+    with pytest.raises(ValueError, match="backend"):
+        DigitalResourceEstimator.sweep(
+            logical_qubits=10, target_runtime=100.0, digital_error_rate=1e-3,
+            backend="cuda",
+        )
+
+
+def test_sweep_outputs_do_not_alias_inputs():
+    runtimes = np.array([1e3, 1e6])
+    result = DigitalResourceEstimator.sweep(
+        logical_qubits=10, target_runtime=runtimes, digital_error_rate=1e-3
+    )
+    runtimes[:] = 0.0
+    result['target_runtime_us'] *= 2
+    result['logical_qubits'] += 1
+
+    np.testing.assert_array_equal(result['target_runtime_us'], [2e3, 2e6])
+    np.testing.assert_array_equal(result['logical_qubits'], [11, 11])
@@ -0,0 +1,193 @@
+"""Tests for ComparisonReport and the report helper functions."""
+
+import json
+
+import pytest
+
+from library.analog_simulator import AnalogSimulator, AnalogSimulatorConfig
+from library.digital_resource_estimator import (
+    DigitalResourceConfig,
+    DigitalResourceEstimator,
+)
+from library import report_generator
+from library.report_generator import (
+    ComparisonReport,
+    format_report_table,
+    generate_comparison_report,
+    save_report_json,
+)
+
+# Section and key layout of generate_comparison_report()
+_REPORT_LAYOUT = {
+    'title': None,
+    'metadata': {'generated_at': None, 'version': None},
+    'analog_simulation': {
+        'circuit_configuration': {
+            'width': None,
+            'individual_t1_times_us': None,
+            'measurement_error_rate': None,
+        },
+        'system_performance': {
+            'system_t1_us': None,
+            'feasible_runtime_us': None,
+            'feasible_runtime_ms': None,
+            'feasible_runtime_s': None,
+        },
+        'error_analysis': {
+            'decoherence_error': None,
+            'total_error': None,
+            'fidelity': None,
+        },
+    },
+    'digital_fault_tolerant': {
+        'logical_configuration': {
+            'logical_qubits': None,
+            'target_runtime_us': None,
+            'target_runtime_s': None,
+            'physical_error_rate': None,
+            'target_logical_error_rate': None,
+        },
+        'error_correction': {
+            'code_distance': None,
+            'physical_qubits_per_logical': None,
+            'logical_gate_time_us': None,
+            'achieved_logical_error_rate': None,
+        },
+        'resource_breakdown': {
+            'data_qubits': None,
+            'magic_state_qubits': None,
+            'compilation_qubits': None,
+            'total_physical_qubits': None,
+        },
+        'performance_metrics': {
+            'logical_gate_count': None,
+            'physical_gate_count': None,
+            'target_runtime_us': None,
+            'wall_clock_time_us': None,
+            'wall_clock_time_seconds': None,
+            'wall_clock_time_hours': None,
+            'space_time_volume_qubit_us': None,
+            'space_time_volume_qubit_s': None,
+            'algorithm_success_probability': None,
+        },
+    },
+    'comparison': {
+        'qubit_count_ratio': None,
+        'runtime_ratio_digital_to_analog': None,
+        'analog_faster': None,
+        'space_time_advantage': {
+            'analog_qubit_seconds': None,
+            'digital_qubit_seconds': None,
+            'ratio': None,
+        },
+    },
+}
+
+
+def _layout(report):
+    """Nested key structure of a report, with leaf values replaced by None."""
+    return {
+        key: _layout(value) if isinstance(value, dict) else None
+        for key, value in report.items()
+    }
+
+
+@pytest.fixture
+def analog_sim():
+    return AnalogSimulator(AnalogSimulatorConfig(circuit_width=20))
+
+
+@pytest.fixture
+def digital_est():
+    return DigitalResourceEstimator(DigitalResourceConfig(
+        logical_qubits=20, target_runtime=1e3, digital_error_rate=1e-3
+    ))
+
+
+@pytest.fixture
+def report(analog_sim, digital_est):
+    return ComparisonReport(analog_sim, digital_est)
+
+
+def test_format_table_is_cached(report):
+    table = report.format_table()
+
+    assert report.format_table() is table
+
+
+def test_to_dict_returns_independent_copy(report):
+    before = report.to_dict()
+    edited = report.to_dict()
+    edited['title'] = 'edited'
+    edited['comparison']['qubit_count_ratio'] = -1.0
+    edited['analog_simulation']['system_performance'].clear()
+
+    assert report.to_dict() == before
+    assert report.comparison['qubit_count_ratio'] != -1.0
+
+
+def test_to_json_leaves_out_rendered_table(report, tmp_path):
+    report.format_table()
+    path = tmp_path / 'report.json'
+    report.to_json(str(path))
+
+    saved = json.loads(path.read_text())
+    assert '_rendered' not in saved
+    assert saved == json.loads(json.dumps(report.to_dict()))
+
+
+def test_generate_comparison_report_layout(analog_sim, digital_est):
+    report = generate_comparison_report(analog_sim, digital_est)
+
+    assert _layout(report) == _REPORT_LAYOUT
+    assert report['title'] == "Quantum Resource Estimation Report"
+
+
+def test_generate_comparison_report_without_metadata(analog_sim, digital_est):
+    report = generate_comparison_report(
+        analog_sim, digital_est, include_metadata=False
+    )
+
+    expected = {k: v for k, v in _REPORT_LAYOUT.items() if k != 'metadata'}
+    assert _layout(report) == expected
+
+
+def test_format_report_table_is_cached(analog_sim, digital_est):
+    report = generate_comparison_report(analog_sim, digital_est)
+    table = format_report_table(report)
+
+    assert report['_rendered'] is table
+    assert format_report_table(report) is table
+
+
+def test_format_report_table_force_rerenders(analog_sim, digital_est):
+    report = generate_comparison_report(analog_sim, digital_est)
+    table = format_report_table(report)
+    report['title'] = "Edited Title"
+
+    assert format_report_table(report) is table
+    rerendered = format_report_table(report, force=True)
+    assert "Edited Title" in rerendered
+    assert "Edited Title" not in table
+    assert report['_rendered'] is rerendered
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_report_json_drops_rendered_table(
+    analog_sim, digital_est, tmp_path, monkeypatch, use_orjson, pretty
+):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(report_generator, 'orjson', None)
+    report = generate_comparison_report(analog_sim, digital_est)
+    format_report_table(report)
+    path = tmp_path / 'report.json'
+    save_report_json(report, str(path), pretty=pretty)
+
+    saved = json.loads(path.read_text())
+    assert '_rendered' not in saved
+    assert _layout(saved) == _REPORT_LAYOUT
+    # The in-memory report keeps its cached table
+    assert '_rendered' in report